@@ -1,11 +1,11 @@
 import contextlib
+import importlib
 import sys
 
 import boa.explorer
 from boa.contracts.base_evm_contract import BoaError
 from boa.contracts.vyper.vyper_contract import check_boa_error_matches
 from boa.dealer import deal
-from boa.debugger import BoaDebug
 from boa.environment import Env
 from boa.explorer import Etherscan, _set_etherscan, get_etherscan
 from boa.interpret import (
@@ -19,13 +19,31 @@ from boa.interpret import (
     loads_partial,
     loads_vyi,
 )
-from boa.network import NetworkEnv
 from boa.precompile import precompile
-from boa.test.strategies import fuzz
 from boa.util.open_ctx import Open
-from boa.verifiers import get_verifier, set_verifier, verify
 from boa.vm.py_evm import enable_pyevm_verbose_logging, patch_opcode
 
+# these pull in heavy dependencies (eth_account, hypothesis, ...) which are
+# not needed for most sessions, so they are only imported on first access.
+# https://peps.python.org/pep-0562/
+_LAZY_IMPORTS = {
+    "BoaDebug": "boa.debugger",
+    "NetworkEnv": "boa.network",
+    "fuzz": "boa.test.strategies",
+    "get_verifier": "boa.verifiers",
+    "set_verifier": "boa.verifiers",
+    "verify": "boa.verifiers",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    ret = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = ret
+    return ret
+
+
 # turn off tracebacks if we are in repl
 # https://stackoverflow.com/a/64523765
 if hasattr(sys, "ps1"):  # pragma: no cover
@@ -41,6 +59,10 @@ def swap_env(new_env):
         yield
 
 
+def _get_env():
+    return env
+
+
 def _set_env(new):
     global env
     env = new
@@ -48,9 +70,7 @@ def _set_env(new):
 
 
 def set_env(new_env):
-    global env
-    get_env = lambda: env  # noqa: E731
-    return Open(get_env, _set_env, new_env)
+    return Open(_get_env, _set_env, new_env)
 
 
 def fork(
@@ -77,6 +97,8 @@ def set_browser_env(address=None):
 
 def set_network_env(url):
     """Set the environment to use a custom network URL"""
+    from boa.network import NetworkEnv
+
     return set_env(NetworkEnv.from_url(url))
 
 
@@ -90,6 +112,8 @@ def reset_env():
 
 
 def _breakpoint(computation):
+    from boa.debugger import BoaDebug
+
     BoaDebug(computation).start()
 
 
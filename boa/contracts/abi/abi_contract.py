@@ -1,6 +1,7 @@
 from collections import defaultdict, namedtuple
-from functools import cached_property
-from typing import Any, Optional, Union
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Optional, Sequence, Union
 from warnings import warn
 
 from eth.abc import ComputationAPI
@@ -15,7 +16,14 @@ from boa.contracts.base_evm_contract import (
 )
 from boa.contracts.call_trace import TraceSource
 from boa.contracts.event_decoder import decode_log
-from boa.util.abi import ABIError, Address, abi_decode, abi_encode, is_abi_encodable
+from boa.util.abi import ABIError, Address, abi_decoder, abi_encoder
+from boa.util.cached_property import cached_property
+from boa.util.lrudict import lrudict
+
+_get_name = itemgetter("name")
+
+# argument types which are safe to use in the calldata cache key
+_CACHEABLE_ARG_TYPES = frozenset((int, bool, str, bytes, Address))
 
 
 class ABIFunction:
@@ -31,6 +39,12 @@ class ABIFunction:
         self._function_visibility = FunctionVisibility.EXTERNAL
         self._mutability = StateMutability.from_abi(abi)
         self.contract: Optional["ABIContract"] = None
+        # bound when the function is attached to a contract, see `_bind`
+        self._execute: Optional[Callable[..., Any]] = None
+        self._address: Optional[Address] = None
+        # calldata for recently seen arguments, e.g. a view function being
+        # polled in a loop with the same arguments. created on first use.
+        self._calldata_cache: Optional[lrudict] = None
 
     @property
     def name(self) -> str | None:
@@ -46,7 +60,11 @@ class ABIFunction:
     def argument_count(self) -> int:
         return len(self.argument_types)
 
-    @property
+    @cached_property
+    def _argument_names(self) -> tuple[str, ...]:
+        return tuple(map(_get_name, self._abi["inputs"]))
+
+    @cached_property
     def signature(self) -> str:
         return _format_abi_type(self.argument_types)
 
@@ -54,7 +72,24 @@ class ABIFunction:
     def return_type(self) -> list:
         return [_abi_from_json(o) for o in self._abi["outputs"]]
 
-    @property
+    @cached_property
+    def _encoder(self) -> Callable[[Any], bytes]:
+        return abi_encoder(self.signature)
+
+    @cached_property
+    def return_schema(self) -> str:
+        return _format_abi_type(self.return_type)
+
+    @cached_property
+    def _decoder(self) -> Callable[[bytes], Any]:
+        return abi_decoder(self.return_schema)
+
+    @cached_property
+    def _has_struct_outputs(self) -> bool:
+        # whether any return value needs to be converted into a namedtuple
+        return any("components" in o for o in self._abi["outputs"])
+
+    @cached_property
     def full_signature(self) -> str:
         assert self.name is not None, "Constructor does not have a name."
         return f"{self.name}{self.signature}"
@@ -72,7 +107,7 @@ class ABIFunction:
     @cached_property
     def method_id(self) -> bytes:
         assert self.name, "Constructor does not have a method id."
-        return method_id(self.name + self.signature)
+        return _compute_method_id(self.name + self.signature)
 
     @cached_property
     def is_constructor(self):
@@ -93,40 +128,75 @@ class ABIFunction:
         if len(kwargs) + len(args) != self.argument_count:
             return False
         parsed_args = self._merge_kwargs(*args, **kwargs)
-        return all(
-            is_abi_encodable(abi_type, arg)
-            for abi_type, arg in zip(self.argument_types, parsed_args)
-        )
+        # a single pass over the whole argument tuple is equivalent to
+        # checking each argument separately, and much cheaper.
+        try:
+            self._encoder(parsed_args)
+            return True
+        except ABIError:
+            return False
 
     def prepare_calldata(self, *args, **kwargs) -> bytes:
         """Prepare the call data for the function call."""
         abi_args = self._merge_kwargs(*args, **kwargs)
-        encoded_args = abi_encode(self.signature, abi_args)
-        if self.is_constructor:
-            return encoded_args
-        return self.method_id + encoded_args
 
-    def _merge_kwargs(self, *args, **kwargs) -> list:
-        """Merge positional and keyword arguments into a single list."""
+        # only cache flat arguments. include the types in the key, since
+        # e.g. `1 == 1.0 == True` but they do not encode the same way (or
+        # may not be encodable at all); nested values (tuples, lists) could
+        # hide such differences from the key, so they are not cached.
+        types = tuple(map(type, abi_args))
+        cache = None
+        if all(t in _CACHEABLE_ARG_TYPES for t in types):
+            if self._calldata_cache is None:
+                self._calldata_cache = lrudict(128)
+            cache = self._calldata_cache
+            key = (tuple(abi_args), types)
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+
+        ret = self._encoder(abi_args)
+        if not self.is_constructor:
+            ret = self.method_id + ret
+
+        if cache is not None:
+            cache[key] = ret
+        return ret
+
+    def _merge_kwargs(self, *args, **kwargs) -> Sequence:
+        """Merge positional and keyword arguments into a single sequence."""
         if len(kwargs) + len(args) != self.argument_count:
             raise TypeError(
                 f"Bad args to `{repr(self)}` (expected {self.argument_count} "
                 f"arguments, got {len(args)} args and {len(kwargs)} kwargs)"
             )
+        if not kwargs:
+            # common case, nothing to merge
+            return args
         try:
-            kwarg_inputs = self._abi["inputs"][len(args) :]
-            return list(args) + [kwargs.pop(i["name"]) for i in kwarg_inputs]
+            kwarg_names = self._argument_names[len(args) :]
+            return [*args, *map(kwargs.pop, kwarg_names)]
         except KeyError as e:
             error = f"Missing keyword argument {e} for `{self.signature}`. Passed {args} {kwargs}"
             raise TypeError(error)
 
+    def _bind(self, contract: "ABIContract"):
+        """
+        Attach this function to a contract. The env and address lookups
+        are resolved once here instead of on every call.
+        """
+        self.contract = contract
+        self._execute = contract.env.execute_code
+        self._address = contract.address
+
     def __call__(self, *args, value=0, gas=None, sender=None, **kwargs):
         """Calls the function with the given arguments based on the ABI contract."""
-        if not self.contract or not self.contract.env:
+        if self._execute is None:
             raise Exception(f"Cannot call {self} without deploying contract.")
 
-        computation = self.contract.env.execute_code(
-            to_address=self.contract.address,
+        computation = self._execute(
+            to_address=self._address,
             sender=sender,
             data=self.prepare_calldata(*args, **kwargs),
             value=value,
@@ -135,25 +205,25 @@ class ABIFunction:
             contract=self.contract,
         )
 
-        val = self.contract.marshal_to_python(computation, self.return_type)
+        val = self.contract.marshal_to_python(computation, self._decoder)
 
         # this property should be guaranteed by abi_decode inside marshal_to_python,
         # assert it again just for clarity
         # note that val should be a tuple.
-        assert len(self._abi["outputs"]) == len(val)
+        item_abis = self._abi["outputs"]
+        n = len(val)
+        assert len(item_abis) == n
 
-        match val:
-            case ():
-                return None
-            case (single,):
-                return _parse_complex(self._abi["outputs"][0], single, name=self.name)
-            case multiple:
-                item_abis = self._abi["outputs"]
-                cls = type(multiple)  # should be tuple
-                return cls(
-                    _parse_complex(abi, item, name=self.name)
-                    for (abi, item) in zip(item_abis, multiple)
-                )
+        if n == 0:
+            return None
+        if n == 1:
+            return _parse_complex(item_abis[0], val[0], name=self.name)
+        if not self._has_struct_outputs:
+            return val
+        return tuple(
+            _parse_complex(abi, item, name=self.name)
+            for (abi, item) in zip(item_abis, val)
+        )
 
 
 class ABIOverload:
@@ -173,17 +243,22 @@ class ABIOverload:
         :param contract: the ABIContract that these functions belong to
         """
         for f in functions:
-            f.contract = contract
+            f._bind(contract)
         if len(functions) == 1:
             return functions[0]
         return ABIOverload(functions)
 
+    __slots__ = ("functions", "name", "_by_argcount")
+
     def __init__(self, functions: list[ABIFunction]):
         self.functions = functions
+        self.name: str | None = functions[0].name
 
-    @cached_property
-    def name(self) -> str | None:
-        return self.functions[0].name
+        # dispatch table so that overload resolution only needs to
+        # type-check the candidates with the right number of arguments
+        self._by_argcount: dict[int, list[ABIFunction]] = defaultdict(list)
+        for f in functions:
+            self._by_argcount[f.argument_count].append(f)
 
     def prepare_calldata(self, *args, disambiguate_signature=None, **kwargs) -> bytes:
         """Prepare the calldata for the function that matches the given arguments."""
@@ -215,7 +290,8 @@ class ABIOverload:
     ) -> ABIFunction:
         """Pick the function that matches the given arguments."""
         if disambiguate_signature is None:
-            matches = [f for f in self.functions if f.is_encodable(*args, **kwargs)]
+            candidates = self._by_argcount.get(len(args) + len(kwargs), [])
+            matches = [f for f in candidates if f.is_encodable(*args, **kwargs)]
         else:
             matches = [
                 f for f in self.functions if disambiguate_signature == f.full_signature
@@ -253,6 +329,7 @@ class ABIContract(_BaseEVMContract):
         env=None,
         nowarn=False,
     ):
+        address = Address(address)
         super().__init__(name, env, filename=filename, address=address)
         self._abi = abi
         self._functions = functions
@@ -273,15 +350,12 @@ class ABIContract(_BaseEVMContract):
             if fn_name is not None:  # constructors have no name
                 setattr(self, fn_name, ABIOverload.create(group, self))
 
-        self._address = Address(address)
-        self._computation: Optional[ComputationAPI] = None
-
     @property
     def abi(self):
         return self._abi
 
     @cached_property
-    def method_id_map(self):
+    def method_id_map(self) -> dict[bytes, ABIFunction]:
         """
         Returns a mapping from method id to function object.
         This is used to create the stack trace when an error occurs.
@@ -314,19 +388,20 @@ class ABIContract(_BaseEVMContract):
     def decode_log(self, log_entry):
         return decode_log(self._address, self.event_for, log_entry)
 
-    def marshal_to_python(self, computation, abi_type: list[str]) -> tuple[Any, ...]:
+    def marshal_to_python(
+        self, computation, decoder: Callable[[bytes], Any]
+    ) -> tuple[Any, ...]:
         """
         Convert the output of a contract call to a Python object.
         :param computation: the computation object returned by `execute_code`
-        :param abi_type: the ABI type of the return value.
+        :param decoder: the ABI decoder for the return value, see `abi_decoder`.
         """
         self._computation = computation
         if computation.is_error:
             return self.handle_error(computation)
 
-        schema = _format_abi_type(abi_type)
         try:
-            return abi_decode(schema, computation.output)
+            return decoder(computation.output)
         except ABIError as e:
             # TODO: the likely error here is that no code exists at the address,
             # it might be better to just let the raw ABIError float up
@@ -340,9 +415,9 @@ class ABIContract(_BaseEVMContract):
         if computation.is_error:
             reason = " ".join(str(arg) for arg in computation.error.args if arg != b"")
 
-        calldata_method_id = bytes(computation.msg.data[:4])
-        if calldata_method_id in self.method_id_map:
-            function = self.method_id_map[calldata_method_id]
+        calldata_method_id = _calldata_method_id(computation)
+        function = self.method_id_map.get(calldata_method_id)
+        if function is not None:
             msg = f"  {reason}({self}.{function.pretty_signature})"
         else:
             # Method might not be specified in the ABI
@@ -356,10 +431,10 @@ class ABIContract(_BaseEVMContract):
         Find the source of the error in the contract.
         :param computation: the computation object returned by `execute_code`
         """
-        method_id_ = computation.msg.data[:4]
-        if method_id_ not in self.method_id_map:
+        function = self.method_id_map.get(_calldata_method_id(computation))
+        if function is None:
             return None
-        return ABITraceSource(self, self.method_id_map[method_id_])
+        return ABITraceSource(self, function)
 
     @property
     def deployer(self) -> "ABIContractFactory":
@@ -390,17 +465,29 @@ class ABIContractFactory:
     def abi(self):
         return self._abi
 
+    @cached_property
+    def _split_abi(self) -> tuple[list[dict], list[dict]]:
+        # sort the ABI into functions and events in a single pass
+        functions, events = [], []
+        for item in self.abi:
+            typ = item.get("type")
+            if typ == "function":
+                functions.append(item)
+            elif typ == "event":
+                events.append(item)
+        return functions, events
+
     @property
     def functions(self):
-        return [
-            ABIFunction(item, self._name)
-            for item in self.abi
-            if item.get("type") == "function"
-        ]
+        # ABIFunctions get bound to a single contract, so they need to be
+        # fresh for every `at()`. the filtering of the ABI does not.
+        function_abis, _ = self._split_abi
+        return [ABIFunction(item, self._name) for item in function_abis]
 
     @property
     def events(self):
-        return [item for item in self.abi if item.get("type") == "event"]
+        _, events = self._split_abi
+        return events
 
     @classmethod
     def from_abi_dict(cls, abi, name="<anonymous contract>", filename=None):
@@ -436,17 +523,33 @@ class ABITraceSource(TraceSource):
     def __repr__(self):
         return repr(self.function)
 
-    @cached_property
+    @property
     def args_abi_type(self):
-        return _format_abi_type(self.function.argument_types)
+        return self.function.signature
 
-    @cached_property
+    @property
     def _argument_names(self) -> list[str]:
-        return [arg["name"] for arg in self.function._abi["inputs"]]
+        # only needed when formatting a call trace
+        return list(self.function._argument_names)
 
-    @cached_property
+    @property
     def return_abi_type(self):
-        return _format_abi_type(self.function.return_type)
+        return self.function.return_schema
+
+
+def _calldata_method_id(computation: ComputationAPI) -> bytes:
+    data = computation.msg.data
+    # msg.data is normally bytes already, in which case slicing is enough
+    if isinstance(data, bytes):
+        return data[:4]
+    return bytes(data[:4])
+
+
+# the same ABIs (e.g. ERC20) get loaded over and over again, share the
+# keccak work between all the ABIFunction instances.
+@lru_cache(maxsize=4096)
+def _compute_method_id(signature: str) -> bytes:
+    return method_id(signature)
 
 
 def _abi_from_json(abi: dict) -> str:
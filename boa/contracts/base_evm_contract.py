@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, NamedTuple, Optional
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional
 
 from eth.abc import ComputationAPI
 
@@ -39,6 +39,12 @@ class _BaseEVMContract:
     def stack_trace(self, computation: ComputationAPI):  # pragma: no cover
         raise NotImplementedError
 
+    def _stack_trace_thunk(self, computation) -> Callable[[], "StackTrace"]:
+        # return a function which computes the stack trace for `computation`.
+        # subclasses can override this to capture any state which might
+        # change before the stack trace is actually materialized.
+        return partial(self.stack_trace, computation)
+
     def call_trace(self) -> TraceFrame:
         assert self._computation is not None, "No computation to trace"
         return self._computation.call_trace
@@ -122,6 +128,24 @@ def _trace_for_unknown_contract(computation, env):
     return _handle_child_trace(computation, env, trace)
 
 
+def _lookup_child_contract(child, env):
+    # TODO: maybe should be:
+    # child_obj = (
+    #   env.lookup_contract(child.msg.code_address)
+    #   or env._code_registry.get(child.msg.code)
+    # )
+    return env.lookup_contract(child.msg.code_address)
+
+
+def _resolve_child_contracts(computation, env):
+    # stack traces are computed lazily, by which time the env may have
+    # changed (e.g. an anchor was exited or an address was reused). pin
+    # the contracts of the failing child frames while the env is current.
+    while len(computation.children) > 0 and computation.children[-1].is_error:
+        computation = computation.children[-1]
+        computation._boa_child_contract = _lookup_child_contract(computation, env)
+
+
 def _handle_child_trace(computation, env, return_trace):
     if len(computation.children) == 0:
         return return_trace
@@ -129,12 +153,12 @@ def _handle_child_trace(computation, env, return_trace):
         return return_trace
     child = computation.children[-1]
 
-    # TODO: maybe should be:
-    # child_obj = (
-    #   env.lookup_contract(child.msg.code_address)
-    #   or env._code_registry.get(child.msg.code)
-    # )
-    child_obj = env.lookup_contract(child.msg.code_address)
+    # use the contract resolved when the error was raised, if any (see
+    # `_resolve_child_contracts`); the env may have changed since then.
+    try:
+        child_obj = child._boa_child_contract
+    except AttributeError:
+        child_obj = _lookup_child_contract(child, env)
 
     if child_obj is None:
         child_trace = _trace_for_unknown_contract(child, env)
@@ -148,18 +172,51 @@ def _handle_child_trace(computation, env, return_trace):
     return StackTrace(child_trace + return_trace)
 
 
-@dataclass
 class BoaError(Exception):
-    call_trace: TraceFrame
-    stack_trace: StackTrace
+    # note: the stack trace is not materialized until it is needed (e.g.
+    # the error is printed), since BoaErrors are frequently caught and
+    # discarded (e.g. by `boa.reverts()`).
+    def __init__(
+        self, call_trace: TraceFrame, stack_trace: StackTrace | Callable[[], StackTrace]
+    ):
+        super().__init__()
+        self.call_trace = call_trace
+        if isinstance(stack_trace, StackTrace):
+            self.stack_trace = stack_trace
+        else:
+            self._compute_stack_trace = stack_trace
+        # set if the caller assigns to `args`
+        self._args: Optional[tuple] = None
+
+    @cached_property
+    def stack_trace(self) -> StackTrace:
+        return self._compute_stack_trace()
+
+    @property  # type: ignore[override]
+    def args(self):
+        if self._args is not None:
+            return self._args
+        # note: this materializes the stack trace
+        return (self.call_trace, self.stack_trace)
+
+    @args.setter
+    def args(self, value):
+        self._args = tuple(value)
+
+    def __reduce__(self):
+        # rebuild from the materialized stack trace, the thunk is not
+        # necessarily copyable or picklable
+        state = None if self._args is None else {"_args": self._args}
+        return (type(self), (self.call_trace, self.stack_trace), state)
 
     @classmethod
     def create(cls, computation: "titanoboa_computation", contract: _BaseEVMContract):
-        return cls(computation.call_trace, contract.stack_trace(computation))
+        _resolve_child_contracts(computation, contract.env)
+        return cls(computation.call_trace, contract._stack_trace_thunk(computation))
+
+    def __repr__(self):
+        return f"{type(self).__name__}(call_trace={self.call_trace!r})"
 
-    # perf TODO: don't materialize the stack trace until we need it,
-    # i.e. BoaError ctor only takes what is necessary to construct the
-    # stack trace but does not require the actual stack trace itself.
     def __str__(self):
         frame = self.stack_trace.last_frame
         if hasattr(frame, "vm_error"):
@@ -1,4 +1,5 @@
 import textwrap
+import weakref
 
 import vyper.ast as vy_ast
 import vyper.semantics.analysis as analysis
@@ -20,6 +21,9 @@ from boa.contracts.vyper.ir_executor import executor_from_ir
 # id used internally for method id name
 _METHOD_ID_VAR = "_calldata_method_id"
 
+# compiler data -> folded constants of its module, see `_swipe_constants`
+_module_constants: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
 
 # visit dst_ast with the constants of src_ast. because of the way we
 # construct the analysis, we don't insert most of the original contract
@@ -27,9 +31,18 @@ _METHOD_ID_VAR = "_calldata_method_id"
 # namespace. however, as of 0.4.0, constant folding doesn't rely on namespace,
 # all the constants are handled by data structures internal to ConstantFolder.
 # here we visit dst_ast with the constants of src_ast.
-def _swipe_constants(src_ast, dst_ast):
+def _swipe_constants(compiler_data, dst_ast):
+    src_ast = compiler_data.annotated_vyper_module
     s = ConstantFolder(src_ast)
-    s._get_constants()
+
+    # collecting the constants walks every constant declaration in the
+    # contract; they don't change, so only do it once per compiler data.
+    try:
+        s._constants = _module_constants[compiler_data]
+    except KeyError:
+        s._get_constants()
+        _module_constants[compiler_data] = s._constants
+
     s.visit(dst_ast)
 
 
@@ -49,7 +62,7 @@ def compile_vyper_function(vyper_function, contract):
 
         # override namespace and add wrapper code at the top
         with contract.override_vyper_namespace():
-            _swipe_constants(compiler_data.annotated_vyper_module, ast)
+            _swipe_constants(compiler_data, ast)
             analysis.analyze_module(ast, compiler_data.input_bundle)
 
         ast = ast.body[0]
@@ -5,6 +5,7 @@
 import contextlib
 import copy
 import warnings
+import weakref
 from collections import namedtuple
 from dataclasses import dataclass
 from functools import cached_property
@@ -56,12 +57,12 @@ from boa.contracts.vyper.decoder_utils import (
 from boa.contracts.vyper.ir_executor import executor_from_ir
 from boa.environment import Env
 from boa.profiling import cache_gas_used_for_computation
-from boa.util.abi import Address, abi_decode, abi_encode
+from boa.util.abi import Address, abi_decode, abi_decoder, abi_encode
 from boa.util.eip1167 import is_eip1167_contract
 from boa.util.eip5202 import generate_blueprint_bytecode
 from boa.util.lrudict import lrudict
 from boa.vm.gas_meters import ProfilingGasMeter
-from boa.vm.utils import to_bytes, to_int
+from boa.vm.utils import to_bytes
 
 # error messages for external calls
 EXTERNAL_CALL_ERRORS = ("external call failed", "returndatasize too small")
@@ -372,17 +373,15 @@ def check_boa_error_matches(error, *args, **kwargs):
 def unwrap_storage_key(sha3_db, k):
     path = []
 
-    def unwrap(k):
-        k_bytes = to_bytes(k)
-        if k_bytes in sha3_db:
-            preimage = sha3_db[k_bytes]
-            slot, k = preimage[:32], preimage[32:]
+    # walk up the chain of preimages iteratively, collecting keys from
+    # the innermost mapping outwards
+    while (k_bytes := to_bytes(k)) in sha3_db:
+        preimage = sha3_db[k_bytes]
+        k, key = preimage[:32], preimage[32:]
+        path.append(key)
 
-            unwrap(slot)
-
-        path.append(k)
-
-    unwrap(k)
+    path.append(k)
+    path.reverse()
     return path
 
 
@@ -418,11 +417,9 @@ class StorageVar:
     def get(self, truncate_limit=None):
         if isinstance(self.typ, HashMapT):
             ret = {}
-            for k in self.contract.env.sstore_trace.get(self.addr, {}):
-                path = unwrap_storage_key(self.contract.env.sha3_trace, k)
-                if to_int(path[0]) != self.slot:
-                    continue
-
+            # note: the sstore trace is keyed by canonical address
+            addr = self.addr.canonical_address
+            for k, path in self.contract.env.sstore_paths(addr, self.slot):
                 path = path[1:]  # drop the slot
                 path_t = []
 
@@ -553,8 +550,13 @@ class VyperContract(_BaseVyperContract):
             )
         self._address = addr
 
+        # external functions are attached lazily, see `__getattr__`.
+        # functions which shadow class attributes need to be set eagerly,
+        # since `__getattr__` is only called when normal lookup fails.
+        self._exposed_fns = exposed_fns
         for fn_name, fn in exposed_fns.items():
-            setattr(self, fn_name, VyperFunction(fn, self))
+            if hasattr(type(self), fn_name):
+                setattr(self, fn_name, VyperFunction(fn, self))
 
         # set internal methods as class.internal attributes:
         self.internal = lambda: None
@@ -568,12 +570,26 @@ class VyperContract(_BaseVyperContract):
         # not sure if this is accurate in the presence of modules
         self._function_id = len(self.module_t.function_defs)
 
-        self._storage = StorageModel(self)
-
         self._eval_cache = lrudict(0x1000)
 
         self.env.register_contract(self._address, self)
 
+    def __getattr__(self, name):
+        # note: use __dict__ to avoid infinite recursion before
+        # `_exposed_fns` is set (e.g. during __init__ or unpickling)
+        fn = self.__dict__.get("_exposed_fns", {}).get(name)
+        if fn is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        ret = VyperFunction(fn, self)
+        # cache it so subsequent lookups don't go through __getattr__
+        setattr(self, name, ret)
+        return ret
+
+    def __dir__(self):
+        return [*super().__dir__(), *self.__dict__.get("_exposed_fns", ())]
+
     def _run_init(self, *args, value=0, override_address=None, gas=None):
         encoded_args = b""
         if self._ctor:
@@ -599,9 +615,7 @@ class VyperContract(_BaseVyperContract):
 
     @cached_property
     def _deployment_source_map(self):
-        with anchor_settings(self.compiler_data.settings):
-            _, source_map = compile_ir.assembly_to_evm(self.compiler_data.assembly)
-            return source_map
+        return _source_map_for(self.compiler_data, "assembly")
 
     # manually set the runtime bytecode, instead of using deploy
     def _set_bytecode(self, bytecode: bytes) -> None:
@@ -632,6 +646,10 @@ class VyperContract(_BaseVyperContract):
 
         return ret
 
+    @cached_property
+    def _storage(self):
+        return StorageModel(self)
+
     @cached_property
     def _immutables(self):
         return ImmutablesModel(self)
@@ -679,9 +697,7 @@ class VyperContract(_BaseVyperContract):
     @property
     def source_map(self):
         if self._source_map is None:
-            with anchor_settings(self.compiler_data.settings):
-                assembly = self.compiler_data.assembly_runtime
-                _, self._source_map = compile_ir.assembly_to_evm(assembly)
+            self._source_map = _source_map_for(self.compiler_data, "assembly_runtime")
         return self._source_map
 
     def find_error_meta(self, computation):
@@ -691,10 +707,11 @@ class VyperContract(_BaseVyperContract):
 
         code_stream = computation.code
         error_map = self.source_map.get("error_map", {})
-        for pc in reversed(code_stream._trace):
-            if pc in error_map:
-                return error_map[pc]
-        return None
+        # find the last pc in the error map. (filter+next runs the loop in C)
+        pc = next(filter(error_map.__contains__, reversed(code_stream._trace)), None)
+        if pc is None:
+            return None
+        return error_map[pc]
 
     def find_source_of(self, computation):
         if hasattr(computation, "vyper_source_pos"):
@@ -703,10 +720,10 @@ class VyperContract(_BaseVyperContract):
 
         code_stream = computation.code
         ast_map = self.source_map["pc_raw_ast_map"]
-        for pc in reversed(code_stream._trace):
-            if pc in ast_map:
-                return ast_map[pc]
-        return None
+        pc = next(filter(ast_map.__contains__, reversed(code_stream._trace)), None)
+        if pc is None:
+            return None
+        return ast_map[pc]
 
     def trace_source(self, computation) -> Optional["VyperTraceSource"]:
         if (node := self.find_source_of(computation)) is None:
@@ -749,8 +766,7 @@ class VyperContract(_BaseVyperContract):
         if len(computation.beneficiaries) > 0:
             return None
 
-        return_typ = calculate_type_for_external_return(vyper_typ)
-        ret = abi_decode(return_typ.abi_type.selector_name(), computation.output)
+        ret = _return_abi_decoder(vyper_typ)(computation.output)
 
         # unwrap the tuple if needed
         if not isinstance(vyper_typ, TupleT):
@@ -761,15 +777,31 @@ class VyperContract(_BaseVyperContract):
     def stack_trace(self, computation=None):
         computation = computation or self._computation
         is_minimal_proxy = is_eip1167_contract(self.bytecode)
-        ret = StackTrace([ErrorDetail.from_computation(self, computation)])
-        error_detail = self.find_error_meta(computation)
+        detail = ErrorDetail.from_computation(self, computation)
+        ret = StackTrace([detail])
+        # reuse the error meta from the ErrorDetail, no need to
+        # scan the trace again
         if (
-            error_detail not in EXTERNAL_CALL_ERRORS + CREATE_ERRORS
+            detail.error_detail not in EXTERNAL_CALL_ERRORS + CREATE_ERRORS
             and not is_minimal_proxy
         ):
             return ret
         return _handle_child_trace(computation, self.env, ret)
 
+    def _stack_trace_thunk(self, computation):
+        # the source map may be anchored (e.g. during deployment or eval),
+        # capture it so the stack trace can be computed after the anchor
+        # has been released.
+        source_map = self._source_map
+        if source_map is None:
+            return super()._stack_trace_thunk(computation)
+
+        def thunk():
+            with self._anchor_source_map(source_map):
+                return self.stack_trace(computation)
+
+        return thunk
+
     def ensure_id(self, fn_t):  # mimic vyper.codegen.module.IDGenerator api
         if fn_t._function_id is None:
             fn_t._function_id = self._function_id
@@ -780,7 +812,8 @@ class VyperContract(_BaseVyperContract):
         module = self.compiler_data.annotated_vyper_module
         # make a copy of the namespace, since we might modify it
         ret = copy.copy(module._metadata["namespace"])
-        ret._scopes = copy.deepcopy(ret._scopes)
+        # scopes are sets of names (str), no need for a full deepcopy
+        ret._scopes = [set(scope) for scope in ret._scopes]
         if len(ret._scopes) == 0:
             # funky behavior in Namespace.enter_scope()
             ret._scopes.append(set())
@@ -864,9 +897,15 @@ class VyperContract(_BaseVyperContract):
 
         # this method is super slow so we cache compilation results
         if stmt not in self._eval_cache:
-            self._eval_cache[stmt] = generate_bytecode_for_arbitrary_stmt(stmt, self)
+            self._eval_cache[stmt] = self._compile_stmt(stmt)
         _, ir_executor, bytecode, source_map, typ = self._eval_cache[stmt]
 
+        if ir_executor is None and self.env.evm._fast_mode_enabled:
+            # loaded from the disk cache, which doesn't store ir executors
+            ret = generate_bytecode_for_arbitrary_stmt(stmt, self)
+            self._eval_cache[stmt] = ret
+            _, ir_executor, bytecode, source_map, typ = ret
+
         with self._anchor_source_map(source_map):
             method_id = b"dbug"  # note dummy method id, doesn't get validated
             c = self.env.execute_code(
@@ -882,6 +921,37 @@ class VyperContract(_BaseVyperContract):
 
             return self.marshal_to_python(c, typ)
 
+    def _compile_stmt(self, stmt):
+        # circular import
+        from boa.interpret import (
+            _disk_cache,
+            _eval_disk_cache_enabled,
+            get_module_fingerprint,
+        )
+
+        # note: the ir executor can't be pickled, so skip the disk cache
+        # in fast mode.
+        if (
+            _disk_cache is None
+            or not _eval_disk_cache_enabled
+            or self.env.evm._fast_mode_enabled
+        ):
+            return generate_bytecode_for_arbitrary_stmt(stmt, self)
+
+        def _compile():
+            ret = generate_bytecode_for_arbitrary_stmt(stmt, self)
+            _, _, bytecode, source_map, typ = ret
+            return bytecode, source_map, typ
+
+        # the generated bytecode embeds the whole contract (including its
+        # data section), so key on all of it
+        fingerprint = get_module_fingerprint(self.module_t)
+        settings = self.compiler_data.settings
+        cache_key = str(("eval", stmt, fingerprint, settings, self.data_section))
+
+        bytecode, source_map, typ = _disk_cache.caching_lookup(cache_key, _compile)
+        return None, None, bytecode, source_map, typ
+
     # inject a function into this VyperContract without affecting the
     # contract's source code. useful for testing private functionality
     def inject_function(self, fn_source_code, force=False):
@@ -912,6 +982,9 @@ class VyperFunction:
         )
         self.__module__ = self.contract.compiler_data.contract_path
 
+        # num_kwargs -> (method_id, args_abi_type), see `args_abi_type`
+        self._signature_cache = {}
+
     def __repr__(self):
         return f"{self.contract.compiler_data.contract_path}.{self.fn_ast.name}"
 
@@ -957,24 +1030,38 @@ class VyperFunction:
 
     # hotspot, cache the signature computation
     def args_abi_type(self, num_kwargs):
-        if not hasattr(self, "_signature_cache"):
-            self._signature_cache = {}
-
-        if num_kwargs in self._signature_cache:
+        try:
             return self._signature_cache[num_kwargs]
+        except KeyError:
+            pass
+
+        # the function type is shared between all contracts with the same
+        # compiler data, so check the shared cache before recomputing.
+        func_t = self.func_t
+        key = (id(func_t), num_kwargs)
+        try:
+            cached_func_t, ret = _shared_signature_cache[key]
+            if cached_func_t is func_t:
+                self._signature_cache[num_kwargs] = ret
+                return ret
+        except KeyError:
+            pass
 
         # align the kwargs with the signature
-        sig_kwargs = self.func_t.keyword_args[:num_kwargs]
-        sig_args = self.func_t.positional_args + sig_kwargs
+        sig_kwargs = func_t.keyword_args[:num_kwargs]
+        sig_args = func_t.positional_args + sig_kwargs
         args_abi_type = (
             "(" + ",".join(arg.typ.abi_type.selector_name() for arg in sig_args) + ")"
         )
-        abi_sig = self.func_t.name + args_abi_type
+        abi_sig = func_t.name + args_abi_type
 
         _method_id = method_id(abi_sig)
-        self._signature_cache[num_kwargs] = (_method_id, args_abi_type)
+        ret = (_method_id, args_abi_type)
+        self._signature_cache[num_kwargs] = ret
+        # note: keep a reference to func_t so that its id stays valid
+        _shared_signature_cache[key] = (func_t, ret)
 
-        return _method_id, args_abi_type
+        return ret
 
     def prepare_calldata(self, *args, **kwargs):
         n_total_args = self.func_t.n_total_args
@@ -989,12 +1076,14 @@ class VyperFunction:
                 f"({expectation_str}, got {len(args)})"
             )
 
-        # align the kwargs with the signature
-        # sig_kwargs = self.func_t.default_args[: len(kwargs)]
-
         total_non_base_args = len(kwargs) + len(args) - n_pos_args
 
-        args = [getattr(arg, "address", arg) for arg in args]
+        # unwrap contracts (and other objects with an `.address`). skip the
+        # getattr for plain values, which are the common case
+        args = [
+            arg if type(arg) in _PLAIN_ARG_TYPES else getattr(arg, "address", arg)
+            for arg in args
+        ]
 
         method_id, args_abi_type = self.args_abi_type(total_non_base_args)
         encoded_args = abi_encode(args_abi_type, args)
@@ -1133,6 +1222,47 @@ def _get_struct_type(st: StructT):
     return typ
 
 
+# argument types which can never have an `.address` to unwrap
+_PLAIN_ARG_TYPES = frozenset((int, bool, str, bytes, Address))
+
+# (id(func_t), num_kwargs) -> (func_t, (method_id, args_abi_type))
+_shared_signature_cache = lrudict(4096)
+
+
+# source maps only depend on the compiler data, share them between all
+# contracts (e.g. many deployments of the same contract in a fuzzing run)
+_source_maps: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _source_map_for(compiler_data, assembly_kind):
+    cache = _source_maps.setdefault(compiler_data, {})
+    if assembly_kind not in cache:
+        with anchor_settings(compiler_data.settings):
+            assembly = getattr(compiler_data, assembly_kind)
+            _, cache[assembly_kind] = compile_ir.assembly_to_evm(assembly)
+    return cache[assembly_kind]
+
+
+# hotspot, the return type of a function does not change between calls.
+# note: keyed by id since some vyper types (e.g. structs) are not hashable;
+# the type is stored alongside the decoder to keep the id alive.
+_return_decoder_cache = lrudict(1024)
+
+
+def _return_abi_decoder(vyper_typ):
+    try:
+        typ, decoder = _return_decoder_cache[id(vyper_typ)]
+        if typ is vyper_typ:
+            return decoder
+    except KeyError:
+        pass
+
+    return_typ = calculate_type_for_external_return(vyper_typ)
+    decoder = abi_decoder(return_typ.abi_type.selector_name())
+    _return_decoder_cache[id(vyper_typ)] = (vyper_typ, decoder)
+    return decoder
+
+
 def vyper_object(val, vyper_type):
     # handling for complex types. recurse
     if isinstance(vyper_type, StructT):
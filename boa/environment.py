@@ -16,6 +16,7 @@ from boa.rpc import RPC, EthereumRPC
 from boa.util.abi import Address
 from boa.vm.gas_meters import GasMeter, NoGasMeter, ProfilingGasMeter
 from boa.vm.py_evm import PyEVM
+from boa.vm.utils import to_int
 
 # make mypy happy
 _AddressType: TypeAlias = Address | str | bytes | PYEVM_Address
@@ -40,6 +41,8 @@ class Env:
 
         self.sha3_trace: dict = {}
         self.sstore_trace: dict = {}
+        # address -> (indexed keys, root slot -> [(key, path)])
+        self._sstore_index: dict = {}
 
         self._gas_tracker = 0
 
@@ -91,9 +94,28 @@ class Env:
         if reset_traces:
             self.sha3_trace = {}
             self.sstore_trace = {}
+            self._sstore_index = {}
 
         self.evm.fork_rpc(rpc, block_identifier, debug=debug, **kwargs)
 
+    def sstore_paths(self, address, slot):
+        """
+        Get the storage keys written by `address` which hash down to
+        `slot`, together with their unwrapped paths (see
+        `unwrap_storage_key`). The index is updated incrementally, so
+        each key in the sstore trace is only unwrapped once.
+        """
+        from boa.contracts.vyper.vyper_contract import unwrap_storage_key
+
+        seen, by_slot = self._sstore_index.setdefault(address, (set(), {}))
+        new_keys = self.sstore_trace.get(address, set()) - seen
+        for k in new_keys:
+            path = unwrap_storage_key(self.sha3_trace, k)
+            by_slot.setdefault(to_int(path[0]), []).append((k, path))
+        seen.update(new_keys)
+
+        return by_slot.get(slot, [])
+
     def get_gas_meter_class(self):
         return self.evm.get_gas_meter_class()
 
@@ -65,6 +65,16 @@ def disable_cache():
     set_cache_dir(None)
 
 
+# eval() compilation results are only persisted to the disk cache
+# when opted into, since every distinct statement adds an entry.
+_eval_disk_cache_enabled = False
+
+
+def enable_eval_cache(flag: bool = True):
+    global _eval_disk_cache_enabled
+    _eval_disk_cache_enabled = flag
+
+
 set_cache_dir()  # enable caching, by default!
 
 
@@ -2,9 +2,11 @@
 import contextlib
 import time
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import cached_property
 from math import ceil
+from typing import Any, Callable
 
 from eth_account import Account
 from requests.exceptions import HTTPError
@@ -22,6 +24,7 @@ from boa.rpc import (
     trim_dict,
 )
 from boa.util.abi import Address
+from boa.util.lrudict import lrudict
 from boa.verifiers import get_verification_bundle
 
 
@@ -34,9 +37,10 @@ class TraceObject:
         # per debug_traceTransaction, construct a fake computation.
         # hardhat/anvil only give structLogs, alchemy only gives callTracer.
         if "structLogs" in self.raw_trace:
-            return self.raw_trace["returnValue"]
+            return self.raw_trace["returnValue"] or "0x"
         else:
-            return self.raw_trace.get("output", "0x")
+            # we can have `"output": null` in the payload
+            return self.raw_trace.get("output") or "0x"
 
     @cached_property
     def returndata_bytes(self):
@@ -68,6 +72,18 @@ class TransactionSettings:
     # amount of time to wait, in seconds before giving up on a transaction
     poll_timeout: float = 240.0
 
+    # max amount of time, in seconds, between polls for a transaction
+    # receipt. polling backs off exponentially up to this value.
+    poll_latency: float = 1.0
+
+    # amount of time, in seconds, to cache the result of eth_gasPrice.
+    # set to 0 to disable caching.
+    gas_price_ttl: float = 2.0
+
+    # amount of time, in seconds, to cache the result of read-only
+    # calls (eth_call). set to 0 to disable caching.
+    eth_call_ttl: float = 0.2
+
 
 @dataclass
 class ExternalAccount:
@@ -170,6 +186,11 @@ class NetworkEnv(Env):
 
         self.nickname = nickname or rpc.name
 
+        # (timestamp, gas price) of the last eth_gasPrice call
+        self._gas_price_cache: tuple[float, int] | None = None
+        # (call args) -> (timestamp, result) for recent eth_calls
+        self._eth_call_cache = lrudict(4096)
+
         self._reset_fork()
 
         self._accounts = accounts or {}
@@ -204,6 +225,8 @@ class NetworkEnv(Env):
             # state is reset after every txn.
         finally:
             self._rpc.fetch("evm_revert", [snapshot_id])
+            # cached eth_call results may be from the reverted state
+            self._eth_call_cache.clear()
             # wipe forked state
             self._reset_fork(block_number)
 
@@ -237,16 +260,39 @@ class NetworkEnv(Env):
     def get_gas_price(self) -> int:
         if self._gas_price is not None:
             return self._gas_price
-        return to_int(self._rpc.fetch("eth_gasPrice", []))
+
+        # gas price changes at most once per block, don't hit the rpc
+        # for every call.
+        now = time.monotonic()
+        if self._gas_price_cache is not None:
+            ts, gas_price = self._gas_price_cache
+            if now - ts < self.tx_settings.gas_price_ttl:
+                return gas_price
+
+        gas_price = to_int(self._rpc.fetch("eth_gasPrice", []))
+        self._gas_price_cache = (now, gas_price)
+        return gas_price
 
     def get_eip1559_fee(self) -> tuple[str, str, str, str]:
         # returns: base_fee, max_fee, max_priority_fee
+        fee, _ = self._fetch_eip1559_fee()
+        return fee
+
+    def get_static_fee(self) -> tuple[str, str]:
+        # non eip-1559 transaction
+        fee, _ = self._fetch_static_fee()
+        return fee
+
+    # fetch fee data, plus any extra requests in the same batch to
+    # save round trips. returns (fee data, extra results)
+    def _fetch_eip1559_fee(self, *extra_reqs):
         reqs = [
             ("eth_getBlockByNumber", ["latest", False]),
             ("eth_maxPriorityFeePerGas", []),
             ("eth_chainId", []),
+            *extra_reqs,
         ]
-        block_info, max_priority_fee, chain_id = self._rpc.fetch_multi(reqs)
+        block_info, max_priority_fee, chain_id, *extra = self._rpc.fetch_multi(reqs)
         base_fee = block_info["baseFeePerGas"]
 
         # Each block increases the base fee by 1/8 at most.
@@ -256,11 +302,13 @@ class NetworkEnv(Env):
         base_fee_estimate = ceil(to_int(base_fee) * (9 / 8) ** blocks_ahead)
 
         max_fee = to_hex(base_fee_estimate + to_int(max_priority_fee))
-        return to_hex(base_fee_estimate), max_priority_fee, max_fee, chain_id
+        fee = (to_hex(base_fee_estimate), max_priority_fee, max_fee, chain_id)
+        return fee, extra
 
-    def get_static_fee(self) -> tuple[str, str]:
-        # non eip-1559 transaction
-        return tuple(self._rpc.fetch_multi([("eth_gasPrice", []), ("eth_chainId", [])]))
+    def _fetch_static_fee(self, *extra_reqs):
+        reqs = [("eth_gasPrice", []), ("eth_chainId", []), *extra_reqs]
+        gas_price, chain_id, *extra = self._rpc.fetch_multi(reqs)
+        return (gas_price, chain_id), extra
 
     def _check_sender(self, address: Address):
         if address is None:
@@ -284,9 +332,26 @@ class NetworkEnv(Env):
             # reset to latest block for code simulation
             self._reset_fork()
 
+        sender = self._check_sender(self._get_sender(sender))
+
+        hexdata = to_hex(data)
+
+        eth_call = None
+        if not is_modifying:
+            args = fixup_dict(
+                {
+                    "from": sender,
+                    "to": to_address,
+                    "gas": gas,
+                    "value": value,
+                    "data": hexdata,
+                }
+            )
+            # the eth_call doesn't depend on the local simulation, so
+            # overlap the network round trip with it.
+            eth_call = self._eth_call(args)
+
         # call execute_code for tracing side effects
-        # note: we could get a perf improvement if we ran this in
-        # the background while waiting on RPC network calls
         computation = super().execute_code(
             to_address=to_address,
             sender=sender,
@@ -297,10 +362,6 @@ class NetworkEnv(Env):
             contract=contract,
         )
 
-        sender = self._check_sender(self._get_sender(sender))
-
-        hexdata = to_hex(data)
-
         if is_modifying:
             try:
                 txdata, receipt, trace = self._send_txn(
@@ -328,16 +389,8 @@ class NetworkEnv(Env):
                     )
 
         else:
-            args = fixup_dict(
-                {
-                    "from": sender,
-                    "to": to_address,
-                    "gas": gas,
-                    "value": value,
-                    "data": hexdata,
-                }
-            )
-            returnvalue = self._rpc.fetch("eth_call", [args, "latest"])
+            assert eth_call is not None
+            returnvalue = eth_call()
             output = to_bytes(returnvalue)
             # we don't need to do the check for computation.is_error
             # because if the eth_call failed it would have just raised
@@ -456,9 +509,15 @@ class NetworkEnv(Env):
             self._rpc.fetch("debug_traceTransaction", [txn_hash, call_tracer])
 
         except RPCError as e:
-            # can't handle callTracer, use default (i.e. structLogs)
+            # can't handle callTracer, use default (i.e. structLogs).
+            # we only need the return value and the error status, so
+            # skip the (potentially huge) per-step memory/stack/storage.
             if e.code == -32602:
-                return {}
+                return {
+                    "disableMemory": True,
+                    "disableStack": True,
+                    "disableStorage": True,
+                }
 
             # catchall - just don't have a tracer
             # note on error codes:
@@ -497,6 +556,48 @@ class NetworkEnv(Env):
 
         return None
 
+    @cached_property
+    def _executor(self):
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="boa-rpc")
+
+    def _in_background(self, fn, *args) -> Future:
+        if not isinstance(self._rpc, EthereumRPC):
+            # other rpcs (e.g. the browser rpc) aren't necessarily safe
+            # to call from another thread, run synchronously.
+            ret: Future = Future()
+            try:
+                ret.set_result(fn(*args))
+            except Exception as e:
+                ret.set_exception(e)
+            return ret
+        return self._executor.submit(fn, *args)
+
+    def _eth_call(self, args) -> Callable[[], Any]:
+        """
+        Start an eth_call and return a function which waits for its result.
+        Only the rpc request runs in the background; the cache is only
+        read and written from the calling thread.
+        """
+        # view functions tend to get called over and over again with
+        # the same arguments (e.g. in a loop), cache them for a short time.
+        now = time.monotonic()
+        key = tuple(args.items())
+        try:
+            ts, ret = self._eth_call_cache[key]
+            if now - ts < self.tx_settings.eth_call_ttl:
+                return lambda: ret
+        except KeyError:
+            pass
+
+        future = self._in_background(self._rpc.fetch, "eth_call", [args, "latest"])
+
+        def result():
+            ret = future.result()
+            self._eth_call_cache[key] = (now, ret)
+            return ret
+
+        return result
+
     def _get_nonce(self, addr):
         return self._rpc.fetch("eth_getTransactionCount", [addr, "latest"])
 
@@ -504,29 +605,47 @@ class NetworkEnv(Env):
         # use "latest" to make sure we are forking with up-to-date state
         # but use reset_traces=False to help with storage dumps
         self.fork_rpc(self._rpc, reset_traces=False, block_identifier=block_identifier)
+        self._gas_price_cache = None
+        self._eth_call_cache.clear()
 
     def _send_txn(self, from_, to=None, gas=None, value=None, data=None):
-        tx_data = fixup_dict(
-            {"from": from_, "to": to, "gas": gas, "value": value, "data": data}
-        )
+        # look up the account up front so we fail before hitting the rpc
+        account = self._accounts.get(from_)
+        if account is None:
+            raise ValueError(f"Account not available: {from_}")
+
+        # note: only drop missing fields. fixup_dict drops all falsy values,
+        # which would silently drop an explicit `gas=0`.
+        tx_data = {"from": to_hex(from_)}
+        for k, v in (("to", to), ("gas", gas), ("value", value), ("data", data)):
+            if v is not None:
+                tx_data[k] = to_hex(v)
+
+        # fetch the nonce in the same batch as the fee data
+        nonce_req = ("eth_getTransactionCount", [from_, "latest"])
 
         try:
             # eip-1559 txn
-            (base_fee, max_priority_fee, max_fee, chain_id) = self.get_eip1559_fee()
+            fee, (nonce,) = self._fetch_eip1559_fee(nonce_req)
+            (base_fee, max_priority_fee, max_fee, chain_id) = fee
             tx_data["maxPriorityFeePerGas"] = max_priority_fee
             tx_data["maxFeePerGas"] = max_fee
             tx_data["chainId"] = chain_id
         except (RPCError, KeyError) as e:
+            # the nonce was part of the failed batch. fetch it on its own
+            # first, so that a nonce error is raised as-is instead of being
+            # mistaken for missing eip-1559 support.
+            nonce = self._get_nonce(from_)
             warnings.warn(
                 "No EIP-1559 transaction available, falling back to legacy",
                 stacklevel=3,
             )
             warnings.warn(str(e), stacklevel=3)
-            gas_price, chain_id = self.get_static_fee()
+            (gas_price, chain_id), _ = self._fetch_static_fee()
             tx_data["gasPrice"] = gas_price
             tx_data["chainId"] = chain_id
 
-        tx_data["nonce"] = self._get_nonce(from_)
+        tx_data["nonce"] = nonce
 
         if gas is None:
             try:
@@ -539,10 +658,6 @@ class NetworkEnv(Env):
                     raise _EstimateGasFailed() from e
                 raise e from e
 
-        if from_ not in self._accounts:
-            raise ValueError(f"Account not available: {from_}")
-        account = self._accounts[from_]
-
         if hasattr(account, "sign_transaction"):
             signed = account.sign_transaction(tx_data)
 
@@ -558,7 +673,13 @@ class NetworkEnv(Env):
         # TODO real logging
         print(f"tx broadcasted: {tx_hash}")
 
-        receipt = self._rpc.wait_for_tx_receipt(tx_hash, self.tx_settings.poll_timeout)
+        # state is about to change, drop cached eth_call results (even if
+        # the txn fails below, e.g. the nonce still changes)
+        self._eth_call_cache.clear()
+
+        receipt = self._rpc.wait_for_tx_receipt(
+            tx_hash, self.tx_settings.poll_timeout, self.tx_settings.poll_latency
+        )
         if receipt.get("status") != "0x1":
             raise Exception(f"txn failed: {receipt}")
 
@@ -1,8 +1,10 @@
+import threading
 import time
 from typing import Any
 from urllib.parse import urlparse
 
 import requests
+from urllib3.util import Retry
 
 try:
     import ujson as json
@@ -82,24 +84,59 @@ class RPC:
         raise NotImplementedError
 
     def wait_for_tx_receipt(self, tx_hash, timeout: float, poll_latency=0.25):
-        start = time.time()
+        deadline = time.monotonic() + timeout
+        # back off exponentially, so that local nodes (which mine
+        # instantly) return quickly without hammering remote nodes.
+        delay = min(0.01, poll_latency)
 
         while True:
             receipt = self.fetch_uncached("eth_getTransactionReceipt", [tx_hash])
             if receipt is not None:
                 return receipt
-            if time.time() + poll_latency > start + timeout:
+            if time.monotonic() + delay > deadline:
                 raise ValueError(f"Timed out waiting for ({tx_hash})")
-            time.sleep(poll_latency)
+            time.sleep(delay)
+            delay = min(delay * 2, poll_latency)
 
 
 class EthereumRPC(RPC):
     def __init__(self, url: str):
         self._rpc_url = url
-        self._session = requests.Session()
+
+        # reuse connections across requests. we may have several requests
+        # in flight at once (e.g. when prefetching state), so make the
+        # pool a bit larger than the default.
+        # retry on connection errors (i.e. the request was never sent,
+        # so it is safe to retry even for eth_sendRawTransaction). note
+        # urllib3 never retries read errors for POST requests.
+        retries = Retry(total=3, connect=3, backoff_factor=0.1)
+        self._adapter = requests.adapters.HTTPAdapter(
+            pool_connections=8, pool_maxsize=16, max_retries=retries
+        )
+
+        # `requests.Session` is not guaranteed to be thread-safe, and
+        # NetworkEnv issues eth_calls from a background thread. use one
+        # session per thread; they share the (thread-safe) connection pool.
+        self._local = threading.local()
+
+    @property
+    def _session(self) -> requests.Session:
+        try:
+            return self._local.session
+        except AttributeError:
+            pass
+
+        session = requests.Session()
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
 
         # declare app name to frame.sh
-        self._session.headers["Origin"] = "Titanoboa"
+        session.headers["Origin"] = "Titanoboa"
+        # we serialize the payloads ourselves, see `_post()`
+        session.headers["Content-Type"] = "application/json"
+
+        self._local.session = session
+        return session
 
     @property
     def identifier(self):
@@ -116,15 +153,24 @@ class EthereumRPC(RPC):
             return f"{partial_ret} (URL partially masked for privacy)"
         return self._rpc_url
 
+    def _post(self, payload):
+        # note: use our json module (ujson, if available) for both encoding
+        # and decoding. `requests` always encodes `json=` payloads with
+        # the stdlib, and `response.text` needs to guess the charset
+        # before decoding, which is slow for large (trace) responses.
+        res = self._session.post(
+            self._rpc_url, data=json.dumps(payload), timeout=TIMEOUT
+        )
+        res.raise_for_status()
+        return json.loads(res.content)
+
     def fetch(self, method, params):
         # the obvious thing to do here is dispatch into fetch_multi.
         # but some providers (alchemy) can't handle batched requests
         # for certain endpoints (debug_traceTransaction).
         req = {"jsonrpc": "2.0", "method": method, "params": params, "id": 0}
         # print(req)
-        res = self._session.post(self._rpc_url, json=req, timeout=TIMEOUT)
-        res.raise_for_status()
-        res = json.loads(res.text)
+        res = self._post(req)
         # print(res)
         if "error" in res:
             raise RPCError.from_json(res["error"])
@@ -135,11 +181,10 @@ class EthereumRPC(RPC):
             {"jsonrpc": "2.0", "method": method, "params": params, "id": i}
             for i, (method, params) in enumerate(payloads)
         ]
-        response = self._session.post(self._rpc_url, json=request, timeout=TIMEOUT)
-        response.raise_for_status()
+        response = self._post(request)
 
         results = {}  # keep results in a dict to preserve order
-        for item in json.loads(response.text):
+        for item in response:
             if "error" in item:
                 raise RPCError.from_json(item["error"])
             results[item["id"]] = item["result"]
@@ -1,6 +1,7 @@
 # wrapper module around whatever encoder we are using
 from collections import deque
-from typing import Annotated, Any
+from functools import partial
+from typing import Annotated, Any, Callable, Optional
 
 from eth.codecs.abi import nodes
 from eth.codecs.abi.decoder import DecodeError, Decoder
@@ -14,6 +15,7 @@ from eth_utils import to_canonical_address, to_checksum_address
 from boa.util.lrudict import lrudict
 
 _parsers: dict[str, ABITypeNode] = {}
+_encoders: dict[str, Callable[[Any], bytes]] = {}
 
 
 # inherit from `str` so that users can compare with regular hex string
@@ -124,14 +126,103 @@ def _get_parser(schema: str):
         return ret
 
 
+class _SlowPath(Exception):
+    pass
+
+
+_TRUE_WORD = (1).to_bytes(32, "big")
+_FALSE_WORD = (0).to_bytes(32, "big")
+
+
+def _static_word_encoder(node: ABITypeNode) -> Optional[Callable[[Any], bytes]]:
+    # encoders for single-word static types which skip the visitor
+    # dispatch. they raise _SlowPath on anything unusual, the full
+    # encoder then handles (and validates) the value.
+    if isinstance(node, nodes.IntegerNode):
+        lo, hi = node.bounds
+        signed = node.is_signed
+
+        def encode_int(value):
+            if type(value) is not int or not lo <= value <= hi:
+                raise _SlowPath
+            return value.to_bytes(32, "big", signed=signed)
+
+        return encode_int
+
+    if isinstance(node, nodes.BooleanNode):
+
+        def encode_bool(value):
+            if value is True:
+                return _TRUE_WORD
+            if value is False:
+                return _FALSE_WORD
+            raise _SlowPath
+
+        return encode_bool
+
+    if isinstance(node, nodes.AddressNode):
+
+        def encode_address(value):
+            if type(value) is not Address:
+                raise _SlowPath
+            return value.canonical_address.rjust(32, b"\x00")
+
+        return encode_address
+
+    return None
+
+
+def _make_encoder(node: ABITypeNode) -> Callable[[Any], bytes]:
+    encode = partial(_ABIEncoder.encode, node)
+
+    if not isinstance(node, nodes.TupleNode):
+        return encode
+
+    word_encoders = [_static_word_encoder(t) for t in node.ctypes]
+    if None in word_encoders:
+        return encode
+
+    n = len(word_encoders)
+
+    # fast path for tuples of single-word static types (e.g. the
+    # arguments to most ERC20-style functions)
+    def fast_encode(value):
+        if type(value) not in (list, tuple) or len(value) != n:
+            return encode(value)
+        try:
+            return b"".join([f(v) for f, v in zip(word_encoders, value)])
+        except _SlowPath:
+            return encode(value)
+
+    return fast_encode
+
+
+def _get_encoder(schema: str) -> Callable[[Any], bytes]:
+    try:
+        return _encoders[schema]
+    except KeyError:
+        _encoders[schema] = (ret := _make_encoder(_get_parser(schema)))
+        return ret
+
+
 def abi_encode(schema: str, data: Any) -> bytes:
-    return _ABIEncoder.encode(_get_parser(schema), data)
+    return _get_encoder(schema)(data)
 
 
 def abi_decode(schema: str, data: bytes) -> Any:
     return _ABIDecoder.decode(_get_parser(schema), data)
 
 
+# variants of abi_encode/abi_decode with the schema bound ahead of time,
+# for hot paths which encode or decode the same schema over and over.
+def abi_encoder(schema: str) -> Callable[[Any], bytes]:
+    return _get_encoder(schema)
+
+
+def abi_decoder(schema: str) -> Callable[[bytes], Any]:
+    return partial(_ABIDecoder.decode, _get_parser(schema))
+
+
 def is_abi_encodable(abi_type: str, data: Any) -> bool:
     try:
         abi_encode(abi_type, data)
@@ -0,0 +1,34 @@
+from typing import Any, Callable, Generic, TypeVar, overload
+
+T = TypeVar("T")
+
+
+# drop-in replacement for `functools.cached_property` for objects which are
+# created in large numbers (e.g. one ABIFunction per ABI entry per contract).
+# on python<3.12, `functools.cached_property` takes a lock on every first
+# access, which is wasted work since boa objects are not shared between
+# threads.
+class cached_property(Generic[T]):
+    def __init__(self, fn: Callable[[Any], T]):
+        self.fn = fn
+        self.attrname = fn.__name__
+        self.__doc__ = fn.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attrname = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> "cached_property[T]":
+        ...
+
+    @overload
+    def __get__(self, instance: object, owner: type) -> T:
+        ...
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        # store in the instance dict, which takes precedence over this
+        # (non-data) descriptor on subsequent lookups.
+        ret = instance.__dict__[self.attrname] = self.fn(instance)
+        return ret
@@ -1,19 +1,34 @@
-class lrudict(dict):
+from collections import OrderedDict
+
+
+# note: OrderedDict.move_to_end() and popitem(last=False) are O(1),
+# whereas the equivalent operations on a plain dict are a delete
+# followed by a re-insert.
+class lrudict(OrderedDict):
     def __init__(self, n, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.n = n
 
     def __getitem__(self, k):
         val = super().__getitem__(k)
-        del self[k]  # move to the front of the queue
-        super().__setitem__(k, val)
+        self.move_to_end(k)  # move to the front of the queue
         return val
 
     def __setitem__(self, k, val):
-        if len(self) == self.n and k not in self:
-            del self[next(iter(self))]
+        if k in self:
+            self.move_to_end(k)
+        elif len(self) >= self.n:
+            if self.n <= 0:
+                # zero capacity, nothing to cache
+                return
+            self.popitem(last=False)
         super().__setitem__(k, val)
 
+    # OrderedDict.__reduce__ would rebuild with `cls()`, which drops `n`
+    # (and fails, since `n` is required). used by copy and pickle.
+    def __reduce__(self):
+        return (type(self), (self.n,), None, None, iter(self.items()))
+
     # set based on a lambda
     def setdefault_lambda(self, k, fn):
         try:
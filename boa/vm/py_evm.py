@@ -101,11 +101,15 @@ class VMPatcher:
 
 
 _opcode_overrides = {}
+# bumped on every patch, so that computation classes know when their
+# cached opcode table is stale.
+_opcode_overrides_version = 0
 
 
 def patch_opcode(opcode_value, fn):
-    global _opcode_overrides
+    global _opcode_overrides, _opcode_overrides_version
     _opcode_overrides[opcode_value] = fn
+    _opcode_overrides_version += 1
 
 
 # _precompiles is a global which is loaded to the env computation
@@ -208,7 +212,7 @@ class Sha3PreimageTracer:
         value = computation._stack.values[-1]
         image = to_bytes(value)
 
-        self.env.sha3_trace[preimage] = image
+        self.env.sha3_trace[image] = preimage
 
 
 class SstoreTracer:
@@ -240,6 +244,11 @@ class SstoreTracer:
 class titanoboa_computation:
     _gas_meter_class = GasMeter
 
+    # the opcode table with `_opcode_overrides` applied, and the state of
+    # the overrides it was built from.
+    _patched_opcodes: Optional[dict] = None
+    _patched_opcodes_tag: Optional[tuple] = None
+
     def __init__(self, *args, **kwargs):
         # super() hardcodes CodeStream into the ctor
         # so we have to override it here
@@ -255,10 +264,16 @@ class titanoboa_computation:
         self._precompiles = self._precompiles.copy()
         self._precompiles.update(_precompiles)
 
-        global _opcode_overrides
-        # copy so as not to mess with class state
-        self.opcodes = self.opcodes.copy()
-        self.opcodes.update(_opcode_overrides)
+        # copying the opcode table for every message is expensive, so the
+        # patched table is built once per computation class and rebuilt
+        # only when the overrides change.
+        cls = type(self)
+        tag = (id(_opcode_overrides), _opcode_overrides_version)
+        if cls._patched_opcodes_tag != tag:
+            # copy so as not to mess with class state
+            cls._patched_opcodes = {**cls.opcodes, **_opcode_overrides}
+            cls._patched_opcodes_tag = tag
+        self.opcodes = cls._patched_opcodes
 
         self._gas_meter = self._gas_meter_class(
             self.msg.gas, refund_strategy=allow_negative_refund_strategy
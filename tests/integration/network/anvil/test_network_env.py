@@ -67,6 +67,23 @@ def test_raise_exception(simple_contract, t):
         simple_contract.raise_exception(t)
 
 
+def test_eth_call_cache_after_transaction(simple_contract):
+    # make sure the second call would be served from the cache if the
+    # cache was not invalidated by the transaction
+    ttl = boa.env.tx_settings.eth_call_ttl
+    boa.env.tx_settings.eth_call_ttl = 3600
+    try:
+        with boa.env.anchor():
+            orig_supply = simple_contract.totalSupply()
+            simple_contract.update_total_supply(1)
+            assert simple_contract.totalSupply() == orig_supply + 1
+
+        # the anchor reverted the transaction
+        assert simple_contract.totalSupply() == orig_supply
+    finally:
+        boa.env.tx_settings.eth_call_ttl = ttl
+
+
 def test_failed_transaction():
     with pytest.raises(Exception) as ctx:
         boa.loads(code, STARTING_SUPPLY, gas=149377)
@@ -2,12 +2,13 @@ import re
 
 import pytest
 import yaml
+from eth.codecs.abi.exceptions import EncodeError
 from eth.constants import ZERO_ADDRESS
 
 import boa
 from boa import BoaError
 from boa.contracts.abi.abi_contract import ABIContractFactory, ABIFunction
-from boa.util.abi import Address, abi_decode
+from boa.util.abi import Address, abi_decode, abi_decoder, abi_encode, abi_encoder
 
 
 def test_abi_decode():
@@ -19,6 +20,14 @@ def test_abi_decode():
     assert val == (0,)
 
 
+def test_abi_encoder_decoder():
+    schema = "(uint256,address,string)"
+    value = (1, Address(ZERO_ADDRESS), "hello")
+    encoded = abi_encoder(schema)(value)
+    assert encoded == abi_encode(schema, value)
+    assert abi_decoder(schema)(encoded) == value
+
+
 def load_via_abi(code, name="test contract"):
     contract = boa.loads(code)
     factory = ABIContractFactory.from_abi_dict(contract.abi, name)
@@ -146,6 +155,12 @@ def test(a: uint128 = 0, b: uint128 = 0) -> uint128:
     (error,) = exc_info.value.args
     assert "Could not find matching test function for given arguments." == error
 
+    # a single overload takes one argument, but it is still checked
+    with pytest.raises(Exception) as exc_info:
+        c.test("a")
+    (error,) = exc_info.value.args
+    assert "Could not find matching test function for given arguments." == error
+
     with pytest.raises(Exception) as exc_info:
         c.test(1, c=2)
     (error,) = exc_info.value.args
@@ -231,6 +246,45 @@ def argumented(n: uint256) -> uint256:
     assert abi_contract.deployer.abi == abi_contract.abi
 
 
+def test_prepare_calldata_cache():
+    code = """
+@external
+def foo(xs: DynArray[uint256, 3], bs: DynArray[bool, 3]) -> uint256:
+    return 0
+
+@external
+def bar(n: uint256, b: bool) -> uint256:
+    return n
+"""
+    abi_contract, _ = load_via_abi(code)
+    bar = abi_contract.bar
+    calldata = bar.prepare_calldata(1, True)
+    assert bar.prepare_calldata(1, True) is calldata
+
+    # equal values of different types do not share a cache entry.
+    # (1, True) is cached, but (1, 1) and (1.0, True) must still fail
+    uint_err = "Error encoding 1.0 as 'uint256' - Value not an instance of type 'int'"
+    bool_err = "Error encoding 1 as 'bool' - Value is not an instance of type 'bool'"
+    with pytest.raises(EncodeError) as exc_info:
+        bar.prepare_calldata(1.0, True)
+    assert str(exc_info.value) == uint_err
+    with pytest.raises(EncodeError) as exc_info:
+        bar.prepare_calldata(1, 1)
+    assert str(exc_info.value) == bool_err
+    assert bar.prepare_calldata(1, True) is calldata
+
+    # nested arguments are not cached, but still encoded and validated
+    foo = abi_contract.foo
+    calldata = foo.prepare_calldata((2, 3), (True, False))
+    assert foo.prepare_calldata([2, 3], [True, False]) == calldata
+    with pytest.raises(EncodeError) as exc_info:
+        foo.prepare_calldata((2.0, 3), (True, False))
+    assert str(exc_info.value) == uint_err.replace("1.0", "2.0")
+    with pytest.raises(EncodeError) as exc_info:
+        foo.prepare_calldata((2, 3), (1, 0))
+    assert str(exc_info.value) == bool_err
+
+
 def test_abi_invalid_components():
     contract = ABIContractFactory.from_abi_dict(
         [
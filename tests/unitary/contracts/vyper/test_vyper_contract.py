@@ -1,3 +1,5 @@
+import pytest
+
 import boa
 
 
@@ -63,6 +65,27 @@ def __init__():
     assert boa.loads(code)._storage.point.get() == [1, 2]
 
 
+def test_decode_nested_hashmap():
+    code = """
+a: HashMap[uint256, uint256]
+b: HashMap[uint256, HashMap[uint256, uint256]]
+
+@external
+def set(i: uint256, j: uint256, v: uint256):
+    self.a[i] = v
+    self.b[i][j] = v
+"""
+    c = boa.loads(code)
+    c.set(1, 2, 3)
+    assert c._storage.a.get() == {1: 3}
+    assert c._storage.b.get() == {1: {2: 3}}
+
+    # keys written after the first read are picked up
+    c.set(4, 5, 6)
+    assert c._storage.a.get() == {1: 3, 4: 6}
+    assert c._storage.b.get() == {1: {2: 3}, 4: {5: 6}}
+
+
 def test_self_destruct():
     code = """
 @external
@@ -302,3 +325,27 @@ def baz(x: uint256, _from: address, y: uint256) -> (MyStruct1, MyStruct2):
     assert type(v).__name__ == "MyStruct2"
     assert v._0 == addy
     assert v.x == 4
+
+
+def test_external_functions_are_attached_lazily():
+    code = """
+@external
+def foo() -> uint256:
+    return 1
+
+@external
+def eval() -> uint256:
+    return 2
+"""
+    c = boa.loads(code)
+    assert "foo" in dir(c)
+    assert "foo" not in vars(c)
+
+    assert c.foo() == 1
+    assert c.foo is c.foo
+
+    # functions which shadow VyperContract methods are still attached
+    assert c.eval() == 2
+
+    with pytest.raises(AttributeError):
+        c.bar()
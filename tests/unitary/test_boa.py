@@ -19,3 +19,17 @@ def test_env_mgr_with_ctx():
 
     assert boa.env is s
     assert boa.env is not t
+
+
+def test_swap_env_deferred():
+    s = boa.env
+    t = boa.Env()
+
+    ctx = boa.swap_env(t)
+    assert boa.env is s
+
+    with ctx as x:
+        assert x is None
+        assert boa.env is t
+
+    assert boa.env is s
@@ -0,0 +1,22 @@
+import boa
+import boa.vm.py_evm
+
+
+def test_patch_opcode_after_execution(monkeypatch):
+    # start from a clean set of overrides, restored at teardown
+    monkeypatch.setattr(boa.vm.py_evm, "_opcode_overrides", {})
+
+    code = """
+@external
+def foo() -> uint256:
+    return block.number
+    """
+    c = boa.loads(code)
+    assert c.foo() == boa.env.evm.patch.block_number
+
+    def fake_number(computation):
+        computation.stack_push_int(1234)
+
+    # the opcode table is cached, make sure patching still takes effect
+    boa.patch_opcode(0x43, fake_number)
+    assert c.foo() == 1234
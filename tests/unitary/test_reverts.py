@@ -1,4 +1,5 @@
 import contextlib
+import copy
 
 import pytest
 
@@ -233,6 +234,60 @@ def revert(contract: HasFoo):
     ]
 
 
+def test_stack_trace_after_address_reuse():
+    c = boa.loads(
+        """
+interface HasFoo:
+     def foo(x: uint256): nonpayable
+
+@external
+def revert(contract: HasFoo):
+    extcall contract.foo(5)
+    """
+    )
+
+    with boa.env.anchor():
+        callee = boa.loads(source_code)
+        with pytest.raises(BoaError) as context:
+            c.revert(callee.address)
+
+    # the anchor reverted the deployment, so the address gets reused
+    other = boa.loads(
+        """
+@external
+def foo(x: uint256):
+    pass
+    """
+    )
+    assert other.address == callee.address
+
+    # the trace is computed lazily but still uses the original callee
+    trace = [
+        (line.contract_repr, line.error_detail, line.pretty_vm_reason)
+        for line in context.value.stack_trace
+    ]
+    assert trace == [
+        (repr(callee), "user revert with reason", "x is not 4"),
+        (repr(c), "external call failed", "x is not 4"),
+    ]
+
+
+def test_boa_error_copy(contract):
+    with pytest.raises(BoaError) as context:
+        contract.foo(5)
+    error = context.value
+
+    error_copy = copy.copy(error)
+    assert type(error_copy) is BoaError
+    assert error_copy.args == error.args
+    assert str(error_copy) == str(error)
+
+    # args can be replaced, e.g. to add context to the error
+    error.args = ("more context", *error.args)
+    assert error.args[0] == "more context"
+    assert copy.copy(error).args == error.args
+
+
 def test_trace_constructor_revert():
     code = """
 @deploy
@@ -0,0 +1,118 @@
+import pytest
+
+from boa.network import NetworkEnv
+from boa.rpc import RPC, RPCError
+
+SENDER = "0x" + "ab" * 20
+
+
+class _FakeRPC(RPC):
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    @property
+    def name(self):
+        return "fake"
+
+    def fetch(self, method, params):
+        self.calls.append(method)
+        ret = self.responses[method]
+        if isinstance(ret, Exception):
+            raise ret
+        return ret
+
+    def fetch_multi(self, payloads):
+        return [self.fetch(method, params) for method, params in payloads]
+
+
+class _FakeAccount:
+    address = SENDER
+
+    def __init__(self):
+        self.sent = []
+
+    def send_transaction(self, tx_data):
+        self.sent.append(tx_data)
+        return {"hash": "0x01"}
+
+
+def _responses(**overrides):
+    ret = {
+        "eth_getBlockByNumber": {"baseFeePerGas": "0x10"},
+        "eth_maxPriorityFeePerGas": "0x1",
+        "eth_gasPrice": "0x20",
+        "eth_chainId": "0x1",
+        "eth_getTransactionCount": "0x5",
+        "eth_estimateGas": "0x5208",
+        "eth_getTransactionReceipt": {
+            "status": "0x1",
+            "blockHash": "0x02",
+            "blockNumber": "0x3",
+        },
+    }
+    ret.update(overrides)
+    return ret
+
+
+@pytest.fixture
+def make_env(monkeypatch):
+    # don't fork, the fake rpc has no state to fork from
+    monkeypatch.setattr(NetworkEnv, "_reset_fork", lambda self, **kwargs: None)
+    monkeypatch.setattr(NetworkEnv, "_tracer", None)
+
+    def make_env(responses):
+        rpc = _FakeRPC(responses)
+        account = _FakeAccount()
+        env = NetworkEnv(rpc, accounts={SENDER: account})
+        return env, rpc, account
+
+    return make_env
+
+
+def test_send_txn_falsy_fields(make_env):
+    # explicit falsy values are sent rather than dropped, and an
+    # explicit gas=0 skips eth_estimateGas
+    env, rpc, account = make_env(_responses())
+    tx_data, _, _ = env._send_txn(SENDER, gas=0, value=0, data=b"")
+
+    assert tx_data["gas"] == "0x0"
+    assert tx_data["value"] == "0x0"
+    assert tx_data["data"] == "0x"
+    assert "to" not in tx_data
+    assert tx_data["nonce"] == "0x5"
+    assert "eth_estimateGas" not in rpc.calls
+    assert account.sent == [tx_data]
+
+
+def test_send_txn_estimates_gas(make_env):
+    env, rpc, _ = make_env(_responses())
+    tx_data, _, _ = env._send_txn(SENDER)
+
+    assert tx_data["gas"] == "0x5208"
+    assert "value" not in tx_data
+    assert "data" not in tx_data
+
+
+def test_send_txn_legacy_fallback(make_env):
+    error = RPCError("method not found", -32601)
+    env, rpc, _ = make_env(_responses(eth_maxPriorityFeePerGas=error))
+
+    with pytest.warns(UserWarning, match="falling back to legacy"):
+        tx_data, _, _ = env._send_txn(SENDER)
+
+    assert tx_data["gasPrice"] == "0x20"
+    assert tx_data["nonce"] == "0x5"
+    assert "maxFeePerGas" not in tx_data
+
+
+def test_send_txn_nonce_error(make_env):
+    # a nonce failure is raised as-is, without a legacy fallback
+    error = RPCError("nonce unavailable", -32000)
+    env, rpc, account = make_env(_responses(eth_getTransactionCount=error))
+
+    with pytest.raises(RPCError, match="nonce unavailable"):
+        env._send_txn(SENDER)
+
+    assert "eth_gasPrice" not in rpc.calls
+    assert account.sent == []
@@ -0,0 +1,30 @@
+import pytest
+
+from boa.util.abi import ABIError, Address, _ABIEncoder, _get_parser, abi_encode
+
+_ADDRESS = Address("0x" + "11" * 20)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        (_ADDRESS, 5, True, -3),
+        [_ADDRESS, 2**256 - 1, False, 127],
+        # values which don't hit the fast path
+        ("0x" + "11" * 20, 1, True, 0),
+        (_ADDRESS, True, False, 0),
+    ],
+)
+def test_static_tuple_fast_path(value):
+    schema = "(address,uint256,bool,int8)"
+    expected = _ABIEncoder.encode(_get_parser(schema), value)
+    assert abi_encode(schema, value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [(_ADDRESS, -1, True, 0), (_ADDRESS, 1, 1, 0), (_ADDRESS, 1, True, 128), (1, 2)],
+)
+def test_static_tuple_fast_path_invalid(value):
+    with pytest.raises(ABIError):
+        abi_encode("(address,uint256,bool,int8)", value)
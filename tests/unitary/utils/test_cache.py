@@ -4,8 +4,15 @@ import pytest
 from packaging.version import Version
 from vyper.compiler import CompilerData
 
+import boa
 from boa.contracts.vyper.vyper_contract import VyperDeployer
-from boa.interpret import _disk_cache, _loads_partial_vvm, compiler_data, set_cache_dir
+from boa.interpret import (
+    _disk_cache,
+    _loads_partial_vvm,
+    compiler_data,
+    enable_eval_cache,
+    set_cache_dir,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -67,6 +74,24 @@ x: constant(int128) = 1000
     assert test1.filename == test2.filename
 
 
+def test_eval_cache_opt_in(tmp_path):
+    c = boa.loads("x: public(uint256)")
+
+    def n_entries():
+        return len(list(tmp_path.rglob("*.pickle")))
+
+    n = n_entries()
+    assert c.eval("self.x + 1") == 1
+    assert n_entries() == n, "eval results are not persisted by default"
+
+    enable_eval_cache()
+    try:
+        assert c.eval("self.x + 2") == 2
+        assert n_entries() == n + 1
+    finally:
+        enable_eval_cache(False)
+
+
 def _to_dict(data: CompilerData) -> dict:
     """
     Serialize the `CompilerData` object to a dictionary for comparison.
@@ -0,0 +1,26 @@
+from boa.util.cached_property import cached_property
+
+
+def test_cached_property():
+    class Foo:
+        def __init__(self):
+            self.calls = 0
+
+        @cached_property
+        def bar(self):
+            self.calls += 1
+            return self.calls
+
+    foo = Foo()
+    assert foo.bar == 1
+    assert foo.bar == 1
+    assert foo.calls == 1
+
+    # cached per instance
+    assert Foo().bar == 1
+
+    # can be reset by deleting the cached value
+    del foo.bar
+    assert foo.bar == 2
+
+    assert isinstance(Foo.bar, cached_property)
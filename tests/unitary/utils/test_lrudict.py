@@ -1,3 +1,8 @@
+import copy
+import pickle
+
+import pytest
+
 from boa.util.lrudict import lrudict
 
 
@@ -15,3 +20,47 @@ def test_lru_set():
         d.setdefault_lambda(x, lambda k: x)
         d[x] = x * 100
     assert d == {k: k * 100 for k in range(10, 20)}
+
+
+def test_lru_eviction_order():
+    d = lrudict(3)
+    d[1] = 1
+    d[2] = 2
+    d[3] = 3
+    # touch 1, so 2 is now the least recently used
+    assert d[1] == 1
+    d[4] = 4
+    assert list(d) == [3, 1, 4]
+
+    # overwriting an existing key also counts as a use
+    d[3] = 30
+    d[5] = 5
+    assert list(d) == [4, 3, 5]
+
+
+def test_lru_zero_capacity():
+    d = lrudict(0)
+    d[1] = 1
+    assert len(d) == 0
+    assert d.setdefault_lambda(1, lambda k: k * 2) == 2
+    assert len(d) == 0
+
+
+@pytest.mark.parametrize(
+    "roundtrip", [copy.copy, copy.deepcopy, lambda d: pickle.loads(pickle.dumps(d))]
+)
+def test_lru_copy_and_pickle(roundtrip):
+    d = lrudict(3)
+    d[1] = [1]
+    d[2] = [2]
+    d[3] = [3]
+    assert d[1] == [1]  # 2 is now the least recently used
+
+    d2 = roundtrip(d)
+    assert type(d2) is lrudict
+    assert d2.n == 3
+    assert list(d2.items()) == list(d.items())
+
+    # capacity and recency order survive the round trip
+    d2[4] = [4]
+    assert list(d2) == [3, 1, 4]
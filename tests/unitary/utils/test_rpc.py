@@ -0,0 +1,32 @@
+import pytest
+
+from boa.rpc import RPC
+
+
+class _FakeRPC(RPC):
+    def __init__(self, pending_polls):
+        self.pending_polls = pending_polls
+        self.calls = 0
+
+    def fetch(self, method, params):
+        assert method == "eth_getTransactionReceipt"
+        self.calls += 1
+        if self.calls > self.pending_polls:
+            return {"status": "0x1"}
+        return None
+
+
+def test_wait_for_tx_receipt_backoff(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("boa.rpc.time.sleep", sleeps.append)
+
+    rpc = _FakeRPC(pending_polls=6)
+    assert rpc.wait_for_tx_receipt("0x00", timeout=60) == {"status": "0x1"}
+    assert rpc.calls == 7
+    assert sleeps == [0.01, 0.02, 0.04, 0.08, 0.16, 0.25]
+
+
+def test_wait_for_tx_receipt_timeout():
+    rpc = _FakeRPC(pending_polls=10**9)
+    with pytest.raises(ValueError, match="Timed out"):
+        rpc.wait_for_tx_receipt("0x00", timeout=0.05)